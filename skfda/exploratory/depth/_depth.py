@@ -195,25 +195,24 @@ class BandDepth(Depth[FDataGrid]):
 
     def transform(self, X: FDataGrid) -> NDArrayFloat:  # noqa: D102
 
-        num_in = np.zeros(shape=len(X), dtype=X.data_matrix.dtype)
+        data_matrix = X.data_matrix
+        num_in = np.zeros(shape=len(X), dtype=data_matrix.dtype)
         n_total = 0
 
-        for f1, f2 in itertools.combinations(self._distribution, 2):
-            between_range_1 = (
-                (f1.data_matrix <= X.data_matrix)
-                & (X.data_matrix <= f2.data_matrix)
+        # Iterate over the raw arrays, as building a FDataGrid for each
+        # curve of each pair dominates the cost otherwise.
+        for f1, f2 in itertools.combinations(
+            self._distribution.data_matrix,
+            2,
+        ):
+            between_range = (
+                (np.minimum(f1, f2) <= data_matrix)
+                & (data_matrix <= np.maximum(f1, f2))
             )
 
-            between_range_2 = (
-                (f2.data_matrix <= X.data_matrix)
-                & (X.data_matrix <= f1.data_matrix)
-            )
-
-            between_range = between_range_1 | between_range_2
-
             num_in += np.all(
                 between_range,
-                axis=tuple(range(1, X.data_matrix.ndim)),
+                axis=tuple(range(1, data_matrix.ndim)),
             )
             n_total += 1
 
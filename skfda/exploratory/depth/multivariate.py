@@ -124,34 +124,62 @@ class Outlyingness(_DepthOrOutlyingness[T]):
     """Abstract class representing an outlyingness function."""
 
 
-def _searchsorted_one_dim(
+def _searchsorted_ordered(
     array: NDArrayFloat,
     values: NDArrayFloat,
     *,
     side: _Side = 'left',
 ) -> NDArrayInt:
-    return np.searchsorted(array, values, side=side)
+    """
+    Find insertion indices of values in sorted arrays along the last axis.
 
+    This is equivalent to applying :func:`numpy.searchsorted` to each pair
+    of rows, but all the rows are processed at once by merging each row
+    of ``values`` with the corresponding row of ``array`` using a stable
+    sort.
 
-_searchsorted_vectorized = np.vectorize(
-    _searchsorted_one_dim,
-    signature='(n),(m),()->(m)',
-    excluded='side',
-)
+    Args:
+        array: Array sorted along the last axis.
+        values: Values to insert, along the last axis.
+        side: If ``'left'``, the index of the first suitable location is
+            given. If ``'right'``, the last one.
 
+    Returns:
+        Insertion indices, with the shape of ``values``.
 
-def _searchsorted_ordered(
-    array: NDArrayFloat,
-    values: NDArrayFloat,
-    *,
-    side: _Side = 'left',
-) -> NDArrayInt:
-    return _searchsorted_vectorized(  # type: ignore[no-any-return]
-        array,
-        values,
-        side=side,
+    """
+    n_array = array.shape[-1]
+    n_values = values.shape[-1]
+    batch_shape = np.broadcast_shapes(array.shape[:-1], values.shape[:-1])
+    array = np.broadcast_to(array, batch_shape + (n_array,))
+    values = np.broadcast_to(values, batch_shape + (n_values,))
+
+    # The stable sort places ties in concatenation order: values go first
+    # to count only the strictly smaller elements.
+    if side == 'left':
+        merged = np.concatenate((values, array), axis=-1)
+        order = np.argsort(merged, axis=-1, kind='stable')
+        is_value = order < n_values
+        value_index = order
+    else:
+        merged = np.concatenate((array, values), axis=-1)
+        order = np.argsort(merged, axis=-1, kind='stable')
+        is_value = order >= n_array
+        value_index = order - n_array
+
+    # Number of elements of array preceding each value in the merge
+    n_before = np.cumsum(~is_value, axis=-1)
+
+    positions = np.empty(batch_shape + (n_values,), dtype=np.intp)
+    np.put_along_axis(
+        positions,
+        value_index[is_value].reshape(positions.shape),
+        n_before[is_value].reshape(positions.shape),
+        axis=-1,
     )
 
+    return positions
+
 
 def _cumulative_distribution(column: NDArrayFloat) -> NDArrayFloat:
     """
@@ -194,15 +222,16 @@ class _UnivariateFraimanMuniz(Depth[NDArrayFloat]):
     """
 
     def fit(self: SelfType, X: NDArrayFloat, y: object = None) -> SelfType:
-        self._sorted_values = np.sort(X, axis=0)
+        # Samples are kept in the last axis, as required by the searches
+        self._sorted_values = np.sort(np.moveaxis(X, 0, -1), axis=-1)
         return self
 
     def transform(self, X: NDArrayFloat) -> NDArrayFloat:
         cum_dist = _searchsorted_ordered(
-            np.moveaxis(self._sorted_values, 0, -1),
+            self._sorted_values,
             np.moveaxis(X, 0, -1),
             side='right',
-        ).astype(X.dtype) / len(self._sorted_values)
+        ).astype(X.dtype) / self._sorted_values.shape[-1]
 
         assert cum_dist.shape[-2] == 1
         ret = 0.5 - np.moveaxis(cum_dist, -1, 0)[..., 0]
@@ -239,7 +268,12 @@ class SimplicialDepth(Depth[NDArrayFloat]):
         self._dim = X.shape[-1]
 
         if self._dim == 1:
-            self.sorted_values = np.sort(X, axis=0)
+            # Samples are kept in the last axis, as required by the searches
+            self._sorted_values_last = np.sort(
+                np.moveaxis(X, 0, -1),
+                axis=-1,
+            )
+            self.sorted_values = np.moveaxis(self._sorted_values_last, -1, 0)
         else:
             raise NotImplementedError(
                 "SimplicialDepth is currently only "
@@ -253,16 +287,18 @@ class SimplicialDepth(Depth[NDArrayFloat]):
         assert self._dim == X.shape[-1]
 
         if self._dim == 1:
+            values = np.moveaxis(X, 0, -1)
+
             positions_left = _searchsorted_ordered(
-                np.moveaxis(self.sorted_values, 0, -1),
-                np.moveaxis(X, 0, -1),
+                self._sorted_values_last,
+                values,
             )
 
             positions_left = np.moveaxis(positions_left, -1, 0)[..., 0]
 
             positions_right = _searchsorted_ordered(
-                np.moveaxis(self.sorted_values, 0, -1),
-                np.moveaxis(X, 0, -1),
+                self._sorted_values_last,
+                values,
                 side='right',
             )
 
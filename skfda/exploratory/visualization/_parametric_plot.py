@@ -7,14 +7,15 @@ of them with domain 1 and codomain 1.
 """
 from __future__ import annotations
 
-from typing import Dict, Sequence, TypeVar
+from typing import Sequence, Tuple, TypeVar
 
 import numpy as np
 from matplotlib.artist import Artist
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
 
-from ...representation import FData
+from ...representation import FData, FDataGrid
+from ...typing._numpy import NDArrayFloat
 from ._baseplot import BasePlot
 from ._utils import ColorLike
 from .representation import Indexable, _get_color_info
@@ -67,21 +68,74 @@ class ParametricPlot(BasePlot):
         self.fdata1 = fdata1
         self.fdata2 = fdata2
 
-        if self.fdata2 is not None:
-            self.fd_final = self.fdata1.concatenate(
-                self.fdata2, as_coordinates=True,
-            )
-        else:
-            self.fd_final = self.fdata1
-
         self.group = group
         self.group_names = group_names
         self.group_colors = group_colors
         self.legend = legend
 
+        self._fd_final: FData | None = None
+
+        # Two scalar FDataGrids are plotted without building their
+        # concatenation, but they are validated in the same way
+        self._plot_directly = (
+            isinstance(fdata1, FDataGrid)
+            and isinstance(fdata2, FDataGrid)
+            and fdata1.dim_domain == fdata2.dim_domain == 1
+            and fdata1.dim_codomain == fdata2.dim_codomain == 1
+        )
+
+        if self._plot_directly:
+            if not np.array_equal(fdata1.grid_points, fdata2.grid_points):
+                raise ValueError(
+                    "All the FDataGrids must be sampled in the same "
+                    "grid points.",
+                )
+
+            if fdata1.n_samples != fdata2.n_samples:
+                raise ValueError(
+                    f"All the FDataGrids must contain the same "
+                    f"number of samples {fdata1.n_samples} to "
+                    f"concatenate as a new coordinate.",
+                )
+
+        elif (
+            self.fd_final.dim_domain != 1
+            or self.fd_final.dim_codomain != 2
+        ):
+            raise ValueError(
+                "Error in data arguments,",
+                "codomain or domain is not correct.",
+            )
+
+    @property
+    def fd_final(self) -> FData:
+        """Functional data object with both coordinates."""
+        if self._fd_final is None:
+            if self.fdata2 is None:
+                self._fd_final = self.fdata1
+            else:
+                self._fd_final = self.fdata1.concatenate(
+                    self.fdata2,
+                    as_coordinates=True,
+                )
+
+        return self._fd_final
+
     @property
     def n_samples(self) -> int:
-        return self.fd_final.n_samples
+        return self.fdata1.n_samples
+
+    def _coordinates(self) -> Tuple[NDArrayFloat, NDArrayFloat]:
+        """Return the values of both coordinates for each sample."""
+        if self._plot_directly:
+            return (
+                self.fdata1.data_matrix[..., 0],
+                self.fdata2.data_matrix[..., 0],
+            )
+
+        data_matrix = self.fd_final.data_matrix
+
+        return data_matrix[..., 0], data_matrix[..., 1]
 
     def _plot(
         self,
@@ -92,47 +146,40 @@ class ParametricPlot(BasePlot):
         self.artists = np.zeros((self.n_samples, 1), dtype=Artist)
 
         sample_colors, patches = _get_color_info(
-            self.fd_final,
+            self.fdata1,
             self.group,
             self.group_names,
             self.group_colors,
             self.legend,
         )
 
-        color_dict: Dict[str, ColorLike | None] = {}
+        x_values, y_values = self._coordinates()
 
-        if (
-            self.fd_final.dim_domain == 1
-            and self.fd_final.dim_codomain == 2
-        ):
-            ax = axes[0]
+        ax = axes[0]
 
-            for i in range(self.fd_final.n_samples):
+        # A single call draws every sample, one line per column
+        lines = ax.plot(x_values.T, y_values.T)
 
-                if sample_colors is not None:
-                    color_dict["color"] = sample_colors[i]
+        for i, line in enumerate(lines):
 
-                self.artists[i, 0] = ax.plot(
-                    self.fd_final.data_matrix[i][:, 0].tolist(),
-                    self.fd_final.data_matrix[i][:, 1].tolist(),
-                    **color_dict,
-                )[0]
+            if sample_colors is not None:
+                line.set_color(sample_colors[i])
 
-        else:
-            raise ValueError(
-                "Error in data arguments,",
-                "codomain or domain is not correct.",
-            )
+            self.artists[i, 0] = line
+
+        if self.fdata1.dataset_name is not None:
+            fig.suptitle(self.fdata1.dataset_name)
 
-        if self.fd_final.dataset_name is not None:
-            fig.suptitle(self.fd_final.dataset_name)
+        coordinate_names = self.fdata1.coordinate_names
+        if self.fdata2 is not None:
+            coordinate_names += self.fdata2.coordinate_names
 
-        if self.fd_final.coordinate_names[0] is None:
+        if coordinate_names[0] is None:
             ax.set_xlabel("Function 1")
         else:
-            ax.set_xlabel(self.fd_final.coordinate_names[0])
+            ax.set_xlabel(coordinate_names[0])
 
-        if self.fd_final.coordinate_names[1] is None:
+        if coordinate_names[1] is None:
             ax.set_ylabel("Function 2")
         else:
-            ax.set_ylabel(self.fd_final.coordinate_names[1])
+            ax.set_ylabel(coordinate_names[1])
@@ -42,9 +42,15 @@ def _classifier_get_depth_methods(
     y_ind: NDArrayInt,
     depth_methods: Sequence[Depth[Input]],
 ) -> Sequence[Depth[Input]]:
-    return [
-        clone(depth_method).fit(X[y_ind == cur_class])
+    # Select the samples of each class only once for all the depths
+    class_samples = (
+        X[y_ind == cur_class]
         for cur_class in range(len(classes))
+    )
+
+    return [
+        clone(depth_method).fit(X_class)
+        for X_class in class_samples
         for depth_method in depth_methods
     ]
 
@@ -246,6 +252,13 @@ class DDGClassifier(
             is ModifiedBandDepth.
         multivariate_classifier:
             The multivariate classifier to use in the DDG-plot.
+        n_jobs:
+            The number of parallel jobs used to compute the depths with
+            respect to each class.
+            ``None`` means 1 unless in a :obj:`joblib.parallel_backend`
+            context.
+            ``-1`` means using all processors. See :term:`Glossary <n_jobs>`
+            for more details.
 
     Examples:
         Firstly, we will import and split the Berkeley Growth Study dataset
@@ -324,9 +337,11 @@ class DDGClassifier(
         depth_method: Depth[Input] | Sequence[
             Tuple[str, Depth[Input]]
         ] | None = None,
+        n_jobs: int | None = None,
     ) -> None:
         self.multivariate_classifier = multivariate_classifier
         self.depth_method = depth_method
+        self.n_jobs = n_jobs
 
     def get_params(self, deep: bool = True) -> Mapping[str, object]:
         params = BaseEstimator.get_params(self, deep=deep)
@@ -421,11 +436,14 @@ class DDGClassifier(
 
         if isinstance(depth_method, Sequence):
             transformer = FeatureUnion([
-                (name, PerClassTransformer(depth))
+                (name, PerClassTransformer(depth, n_jobs=self.n_jobs))
                 for name, depth in depth_method
             ])
         else:
-            transformer = PerClassTransformer(depth_method)
+            transformer = PerClassTransformer(
+                depth_method,
+                n_jobs=self.n_jobs,
+            )
 
         self._pipeline = make_pipeline(
             transformer,
@@ -521,6 +539,10 @@ class MaximumDepthClassifier(DDGClassifier[Input, Target]):
             The depth class to use when calculating the depth of a test
             sample in a class. See the documentation of the depths module
             for a list of available depths. By default it is ModifiedBandDepth.
+        n_jobs:
+            The number of parallel jobs used to compute the depths with
+            respect to each class, as in
+            :class:`~skfda.ml.classification.DDGClassifier`.
 
     Examples:
         Firstly, we will import and split the Berkeley Growth Study dataset
@@ -560,8 +582,13 @@ class MaximumDepthClassifier(DDGClassifier[Input, Target]):
 
     """
 
-    def __init__(self, depth_method: Depth[Input] | None = None) -> None:
+    def __init__(
+        self,
+        depth_method: Depth[Input] | None = None,
+        n_jobs: int | None = None,
+    ) -> None:
         super().__init__(
             multivariate_classifier=_ArgMaxClassifier(),
             depth_method=depth_method,
+            n_jobs=n_jobs,
         )
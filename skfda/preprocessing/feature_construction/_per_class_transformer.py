@@ -6,6 +6,7 @@ from typing import Any, Mapping, Sequence, Tuple, TypeVar, Union
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 from sklearn.base import clone
 from sklearn.utils.validation import check_is_fitted as sklearn_check_is_fitted
 
@@ -33,9 +34,11 @@ def _fit_feature_transformer(  # noqa: WPS320 WPS234
 
     classes, y_ind = _classifier_get_classes(y)
 
+    class_masks = (y_ind == cur_class for cur_class in range(len(classes)))
+
     class_feature_transformers = [
-        clone(transformer).fit(X[y_ind == cur_class], y[y_ind == cur_class])
-        for cur_class, _ in enumerate(classes)
+        clone(transformer).fit(X[mask], y[mask])
+        for mask in class_masks
     ]
 
     return classes, class_feature_transformers
@@ -64,6 +67,13 @@ class PerClassTransformer(TransformerMixin[Input, Output, NDArrayInt]):
         array_output:
             Indicates if the transformed data is requested to be a NumPy array
             output. By default the value is False.
+        n_jobs:
+            The number of parallel jobs used to transform the data with the
+            transformer fitted for each class.
+            ``None`` means 1 unless in a :obj:`joblib.parallel_backend`
+            context.
+            ``-1`` means using all processors. See :term:`Glossary <n_jobs>`
+            for more details.
 
     Examples:
         Firstly, we will import the Berkeley Growth Study dataset:
@@ -158,9 +168,11 @@ class PerClassTransformer(TransformerMixin[Input, Output, NDArrayInt]):
         transformer: TransformerMixin[Input, TransformerOutput, object],
         *,
         array_output: bool = False,
+        n_jobs: int | None = None,
     ) -> None:
         self.transformer = transformer
         self.array_output = array_output
+        self.n_jobs = n_jobs
 
     def _more_tags(self) -> Mapping[str, Any]:
         parent_tags = super()._more_tags()
@@ -262,10 +274,11 @@ class PerClassTransformer(TransformerMixin[Input, Output, NDArrayInt]):
         """
         sklearn_check_is_fitted(self)
 
-        transformed_data = [
-            feature_transformer.transform(X)
+        # Threads are used, as NumPy releases the GIL in the heavy parts
+        transformed_data = Parallel(n_jobs=self.n_jobs, prefer="threads")(
+            delayed(feature_transformer.transform)(X)
             for feature_transformer in self._class_feature_transformers_
-        ]
+        )
 
         if self.array_output:
             for data in transformed_data:
@@ -276,7 +289,9 @@ class PerClassTransformer(TransformerMixin[Input, Output, NDArrayInt]):
                         "array.",
                     )
 
-            return np.hstack(transformed_data)  # type: ignore[return-value]
+            return np.column_stack(  # type: ignore[return-value]
+                transformed_data,
+            )
 
         return pd.concat(  # type: ignore[no-any-return]
             [
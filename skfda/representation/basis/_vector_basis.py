@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 import warnings
-from typing import Any, Iterable, Tuple, TypeVar, Union
+from typing import Any, Dict, Iterable, Tuple, TypeVar, Union
 
 import numpy as np
-import scipy.linalg
 
 from ...typing._numpy import NDArrayFloat
 from ._basis import Basis
@@ -87,6 +86,16 @@ class VectorValuedBasis(Basis):
 
         self._basis_list = basis_list
 
+        # Coordinate in which each basis function is nonzero
+        self._codomain_indexes = np.repeat(
+            np.arange(len(basis_list)),
+            [b.n_basis for b in basis_list],
+        )
+
+        # The domain range can change in copies, but not the basis list,
+        # so its hash is computed once when first needed
+        self._basis_list_hash: int | None = None
+
         super().__init__(
             domain_range=basis_list[0].domain_range,
             n_basis=sum(b.n_basis for b in basis_list),
@@ -105,16 +114,37 @@ class VectorValuedBasis(Basis):
         return len(self.basis_list)
 
     def _evaluate(self, eval_points: NDArrayFloat) -> NDArrayFloat:
-        matrix = np.zeros((self.n_basis, len(eval_points), self.dim_codomain))
+        # The same grid is usually evaluated repeatedly, so the last
+        # evaluation is kept
+        key = (eval_points.shape, eval_points.dtype.str, eval_points.tobytes())
+        cached = getattr(self, "_evaluate_cached", None)
+
+        if cached is None or cached[0] != key:
+            cached = (key, self._evaluate_uncached(eval_points))
+            self._evaluate_cached = cached
 
-        n_basis_eval = 0
+        return cached[1].copy()
 
-        basis_evaluations = [b(eval_points) for b in self.basis_list]
+    def _evaluate_uncached(self, eval_points: NDArrayFloat) -> NDArrayFloat:
+        basis_evaluations = [b(eval_points)[..., 0] for b in self.basis_list]
 
-        for i, ev in enumerate(basis_evaluations):
+        if self.dim_codomain == 2:
+            # Common case of planar curves, written as two blocks
+            first, second = basis_evaluations
+            n_first = len(first)
 
-            matrix[n_basis_eval:n_basis_eval + len(ev), :, i] = ev[..., 0]
-            n_basis_eval += len(ev)
+            matrix = np.zeros((self.n_basis, len(eval_points), 2))
+            matrix[:n_first, :, 0] = first
+            matrix[n_first:, :, 1] = second
+
+            return matrix
+
+        flat = np.concatenate(basis_evaluations, axis=0)
+
+        # Each basis function is nonzero only in the coordinate of its
+        # scalar basis, so only those entries need to be written.
+        matrix = np.zeros((self.n_basis, len(eval_points), self.dim_codomain))
+        matrix[np.arange(self.n_basis), :, self._codomain_indexes] = flat
 
         return matrix
 
@@ -124,20 +154,31 @@ class VectorValuedBasis(Basis):
         order: int = 1,
     ) -> Tuple[T, NDArrayFloat]:
 
-        n_basis_list = [b.n_basis for b in self.basis_list]
-        indexes = np.cumsum(n_basis_list)
-
-        coefs_per_basis = np.hsplit(coefs, indexes[:-1])
+        offsets = np.cumsum([0] + [b.n_basis for b in self.basis_list])
 
         basis_and_coefs = [
-            b._derivative_basis_and_coefs(c, order=order)  # noqa: WPS437
-            for b, c in zip(self.basis_list, coefs_per_basis)
+            b._derivative_basis_and_coefs(  # noqa: WPS437
+                coefs[:, start:stop],
+                order=order,
+            )
+            for b, start, stop in zip(self.basis_list, offsets, offsets[1:])
         ]
 
         new_basis_list, new_coefs_list = zip(*basis_and_coefs)
 
         new_basis = type(self)(new_basis_list)
-        new_coefs = np.hstack(new_coefs_list)
+
+        new_offsets = np.cumsum([0] + [c.shape[1] for c in new_coefs_list])
+        new_coefs = np.empty(
+            (len(coefs), new_offsets[-1]),
+            dtype=np.result_type(*new_coefs_list),
+        )
+        for new_c, start, stop in zip(
+            new_coefs_list,
+            new_offsets,
+            new_offsets[1:],
+        ):
+            new_coefs[:, start:stop] = new_c
 
         return new_basis, new_coefs
 
@@ -145,9 +186,15 @@ class VectorValuedBasis(Basis):
 
         gram_matrices = [b.gram_matrix() for b in self.basis_list]
 
-        return scipy.linalg.block_diag(  # type: ignore[no-any-return]
-            *gram_matrices,
-        )
+        gram = np.zeros((self.n_basis, self.n_basis))
+
+        offset = 0
+        for g in gram_matrices:
+            size = len(g)
+            gram[offset:offset + size, offset:offset + size] = g
+            offset += size
+
+        return gram
 
     def _coordinate_nonfull(
         self,
@@ -155,20 +202,39 @@ class VectorValuedBasis(Basis):
         key: Union[int, slice],
     ) -> Tuple[Basis, NDArrayFloat]:
 
-        basis_sizes = [b.n_basis for b in self.basis_list]
-        basis_indexes = np.cumsum(basis_sizes)
-        coef_splits = np.split(coefs, basis_indexes[:-1], axis=1)
+        offsets = np.cumsum([0] + [b.n_basis for b in self.basis_list])
+        r_key = range(self.dim_codomain)[key]
 
         new_basis = self.basis_list[key]
         if not isinstance(new_basis, Basis):
             new_basis = VectorValuedBasis(new_basis)
 
-        new_coefs = coef_splits[key]
-        if not isinstance(new_coefs, np.ndarray):
-            new_coefs = np.concatenate(coef_splits[key], axis=1)
+        if isinstance(r_key, int):
+            new_coefs = coefs[:, offsets[r_key]:offsets[r_key + 1]]
+        elif r_key.step > 0:
+            mask = np.zeros(self.n_basis, dtype=bool)
+            for i in r_key:
+                mask[offsets[i]:offsets[i + 1]] = True
+
+            new_coefs = coefs[:, mask]
+        else:
+            # A mask cannot reverse the order of the coordinates
+            new_coefs = np.concatenate(
+                [coefs[:, offsets[i]:offsets[i + 1]] for i in r_key],
+                axis=1,
+            )
 
         return new_basis, new_coefs
 
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        # Memoized values are not part of the state: the evaluation cache
+        # is not copied nor pickled, and the hash of the basis list is not
+        # stable across processes, as string hashes are randomized
+        state.pop("_evaluate_cached", None)
+        state["_basis_list_hash"] = None
+        return state
+
     def __repr__(self) -> str:
         """Representation of a Basis object."""
         return f"{self.__class__.__name__}(" f"basis_list={self.basis_list})"
@@ -177,7 +243,10 @@ class VectorValuedBasis(Basis):
         return super().__eq__(other) and self.basis_list == other.basis_list
 
     def __hash__(self) -> int:
-        return hash((super().__hash__(), self.basis_list))
+        if self._basis_list_hash is None:
+            self._basis_list_hash = hash(self.basis_list)
+
+        return hash((super().__hash__(), self._basis_list_hash))
 
 
 class VectorValued(VectorValuedBasis):
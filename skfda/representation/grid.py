@@ -1547,15 +1547,21 @@ class _CoordinateIterator(Sequence[T]):
         key: Union[int, slice, NDArrayInt, NDArrayBool],
     ) -> T:
         """Get a specific coordinate."""
-        s_key = key
-        if isinstance(s_key, int):
-            s_key = slice(s_key, s_key + 1)
+        coordinate_names = self._fdatagrid.coordinate_names
 
-        coordinate_names = np.array(self._fdatagrid.coordinate_names)[s_key]
+        # Avoid building an array of names unless indexing requires it
+        if isinstance(key, int):
+            coordinate_names = (coordinate_names[key],)
+        elif isinstance(key, slice):
+            coordinate_names = coordinate_names[key]
+        else:
+            coordinate_names = tuple(
+                np.array(coordinate_names, dtype=object)[key],
+            )
 
         return self._fdatagrid.copy(
             data_matrix=self._fdatagrid.data_matrix[..., key],
-            coordinate_names=tuple(coordinate_names),
+            coordinate_names=coordinate_names,
         )
 
     def __len__(self) -> int:
@@ -1,6 +1,7 @@
 """Tests of basis functions."""
 
 import itertools
+import pickle
 import unittest
 
 import numpy as np
@@ -12,9 +13,11 @@ from skfda.misc import inner_product_matrix
 from skfda.representation.basis import (
     BSplineBasis,
     ConstantBasis,
+    CustomBasis,
     FDataBasis,
     FourierBasis,
     MonomialBasis,
+    VectorValuedBasis,
 )
 from skfda.representation.grid import FDataGrid
 
@@ -653,6 +656,112 @@ class TestVectorValuedBasis(unittest.TestCase):
             X.coordinates[1].to_basis(basis_dim).coefficients,
         )
 
+    def _expected_evaluation(
+        self,
+        basis: VectorValuedBasis,
+        eval_points: np.typing.NDArray[np.float_],
+    ) -> np.typing.NDArray[np.float_]:
+        """Evaluate each coordinate basis separately."""
+        expected = np.zeros(
+            (basis.n_basis, len(eval_points), basis.dim_codomain),
+        )
+        start = 0
+        for i, b in enumerate(basis.basis_list):
+            expected[start:start + b.n_basis, :, i] = b(eval_points)[..., 0]
+            start += b.n_basis
+
+        return expected
+
+    def test_evaluation_cache_different_points(self) -> None:
+        """Test that points with the same shape are not mixed up."""
+        basis = VectorValuedBasis([
+            MonomialBasis(n_basis=3),
+            FourierBasis(n_basis=3),
+        ])
+        eval_points = np.array([0.1, 0.5, 0.9])
+        other_points = np.array([0.2, 0.4, 0.6])
+
+        basis(eval_points)
+
+        np.testing.assert_allclose(
+            basis(other_points),
+            self._expected_evaluation(basis, other_points),
+        )
+
+    def test_evaluation_cache_mutation(self) -> None:
+        """Test that modifying an evaluation does not change later ones."""
+        basis = VectorValuedBasis([
+            MonomialBasis(n_basis=3),
+            FourierBasis(n_basis=3),
+        ])
+        eval_points = np.array([0.1, 0.5, 0.9])
+
+        evaluation = basis(eval_points)
+        evaluation[...] = np.nan
+
+        np.testing.assert_allclose(
+            basis(eval_points),
+            self._expected_evaluation(basis, eval_points),
+        )
+
+    def test_evaluation_cache_copy(self) -> None:
+        """Test that copies with a new domain evaluate correctly."""
+        basis = VectorValuedBasis([
+            MonomialBasis(n_basis=3),
+            FourierBasis(n_basis=3),
+        ])
+        eval_points = np.array([0.1, 0.5, 0.9])
+
+        basis(eval_points)
+        basis_copy = basis.copy(domain_range=(0, 2))
+
+        np.testing.assert_allclose(
+            basis_copy(eval_points),
+            self._expected_evaluation(basis_copy, eval_points),
+        )
+
+    def test_pickle(self) -> None:
+        """Test that unpickled bases evaluate and hash correctly."""
+        basis = VectorValuedBasis([
+            MonomialBasis(n_basis=3),
+            FourierBasis(n_basis=3),
+        ])
+        eval_points = np.array([0.1, 0.5, 0.9])
+
+        basis(eval_points)
+        hash(basis)
+        basis_unpickled = pickle.loads(pickle.dumps(basis))
+
+        self.assertEqual(basis_unpickled, basis)
+        self.assertEqual(hash(basis_unpickled), hash(basis))
+        np.testing.assert_allclose(
+            basis_unpickled(eval_points),
+            self._expected_evaluation(basis, eval_points),
+        )
+
+    def test_unhashable_coordinate_basis(self) -> None:
+        """Test that unhashable coordinate bases can be used."""
+        custom_basis = CustomBasis(
+            fdata=FDataGrid(
+                [[0, 1, 2], [1, 1, 1]],
+                grid_points=[0, 0.5, 1],
+            ),
+        )
+        monomial_basis = MonomialBasis(n_basis=2)
+        basis = VectorValuedBasis([custom_basis, monomial_basis])
+        eval_points = np.array([0.0, 0.5, 1.0])
+
+        evaluation = basis(eval_points)
+
+        np.testing.assert_allclose(
+            evaluation[:2, :, 0],
+            custom_basis(eval_points)[..., 0],
+        )
+        np.testing.assert_allclose(
+            evaluation[2:, :, 1],
+            monomial_basis(eval_points)[..., 0],
+        )
+
 
 class TestTensorBasis(unittest.TestCase):
     """Tests for the Tensor basis."""
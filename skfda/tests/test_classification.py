@@ -8,6 +8,7 @@ from sklearn.model_selection import train_test_split
 from sklearn.neighbors import KNeighborsClassifier as _KNeighborsClassifier
 
 from skfda.datasets import fetch_growth
+from skfda.exploratory.depth import IntegratedDepth, ModifiedBandDepth
 from skfda.misc.metrics import l2_distance
 from skfda.ml.classification import (
     DDClassifier,
@@ -19,7 +20,7 @@ from skfda.ml.classification import (
     RadiusNeighborsClassifier,
 )
 from skfda.ml.classification._depth_classifiers import _ArgMaxClassifier
-from skfda.representation import FData
+from skfda.representation import FData, FDataGrid
 
 
 class TestClassifiers(unittest.TestCase):
@@ -186,5 +187,58 @@ class TestClassifiers(unittest.TestCase):
             clf.predict(self._X_test)
 
 
+class TestDDGClassifierParallel(unittest.TestCase):
+    """Tests for the parallel computation of depths in DDG classifiers."""
+
+    def setUp(self) -> None:
+        """Generate two separated classes of curves."""
+        random_state = np.random.RandomState(0)
+        self._X = FDataGrid(
+            np.concatenate((
+                random_state.normal(size=(20, 10)),
+                random_state.normal(loc=1, size=(20, 10)),
+            )),
+        )
+        self._y = np.repeat([0, 1], 20)
+
+    def test_ddg_classifier_n_jobs(self) -> None:
+        """Check that parallel jobs give the same predictions."""
+        for depth_method in (
+            ModifiedBandDepth(),
+            [("mbd", ModifiedBandDepth()), ("id", IntegratedDepth())],
+        ):
+            with self.subTest(depth_method=depth_method):
+                sequential: DDGClassifier[FData] = DDGClassifier(
+                    depth_method=depth_method,
+                    multivariate_classifier=_KNeighborsClassifier(),
+                )
+                parallel: DDGClassifier[FData] = DDGClassifier(
+                    depth_method=depth_method,
+                    multivariate_classifier=_KNeighborsClassifier(),
+                    n_jobs=2,
+                )
+                sequential.fit(self._X, self._y)
+                parallel.fit(self._X, self._y)
+
+                np.testing.assert_array_equal(
+                    parallel.predict(self._X),
+                    sequential.predict(self._X),
+                )
+
+    def test_maximumdepth_n_jobs(self) -> None:
+        """Check that parallel jobs give the same predictions."""
+        sequential: MaximumDepthClassifier[FData] = MaximumDepthClassifier()
+        parallel: MaximumDepthClassifier[FData] = MaximumDepthClassifier(
+            n_jobs=2,
+        )
+        sequential.fit(self._X, self._y)
+        parallel.fit(self._X, self._y)
+
+        np.testing.assert_array_equal(
+            parallel.predict(self._X),
+            sequential.predict(self._X),
+        )
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -43,3 +43,43 @@ class TestsDepthSameCurves(unittest.TestCase):
             depth(self.fd),
             [1, 1, 1, 1, 1],
         )
+
+
+class TestsDepthSinglePrecision(unittest.TestCase):
+    """Test that single precision data can be used directly."""
+
+    def setUp(self) -> None:
+        """Define the dataset."""
+        data_matrix = [
+            [1, 1, 2, 3, 2.5, 2],
+            [0.5, 0.5, 1, 2, 1.5, 1],
+            [-1, -1, -0.5, 1, 1, 0.5],
+            [-0.5, -0.5, -0.5, -1, -1, -1],
+        ]
+        grid_points = [0, 2, 4, 6, 8, 10]
+
+        self.fd = skfda.FDataGrid(data_matrix, grid_points)
+        self.fd_single = skfda.FDataGrid(
+            np.asarray(data_matrix, dtype=np.float32),
+            grid_points,
+        )
+
+    def test_integrated_single_precision(self) -> None:
+        """Test the Fraiman-Muñiz depth with float32 data."""
+        depth = IntegratedDepth()
+
+        np.testing.assert_allclose(
+            depth(self.fd_single),
+            depth(self.fd),
+            rtol=1e-6,
+        )
+
+    def test_modified_band_depth_single_precision(self) -> None:
+        """Test MBD with float32 data."""
+        depth = ModifiedBandDepth()
+
+        np.testing.assert_allclose(
+            depth(self.fd_single),
+            depth(self.fd),
+            rtol=1e-6,
+        )
@@ -209,6 +209,40 @@ class TestFDataGrid(unittest.TestCase):
             fd.data_matrix,
         )
 
+    def test_coordinates_names(self) -> None:
+        """Test the coordinate names of the selected coordinates."""
+        fd = FDataGrid(
+            np.arange(24).reshape(2, 4, 3),
+            grid_points=[0, 1, 2, 3],
+            coordinate_names=("a", "b", "c"),
+        )
+
+        # Negative index
+        last = fd.coordinates[-1]
+        self.assertEqual(last.coordinate_names, ("c",))
+        np.testing.assert_array_equal(
+            last.data_matrix,
+            fd.data_matrix[..., -1:],
+        )
+
+        # Integer array and boolean mask
+        for key in (
+            np.array([2, 0]),
+            np.array([True, False, True]),
+        ):
+            with self.subTest(key=key):
+                selected = fd.coordinates[key]
+                expected_names = tuple(
+                    np.array(fd.coordinate_names)[key].tolist(),
+                )
+                self.assertEqual(selected.coordinate_names, expected_names)
+                for name in selected.coordinate_names:
+                    self.assertIs(type(name), str)
+                np.testing.assert_array_equal(
+                    selected.data_matrix,
+                    fd.data_matrix[..., key],
+                )
+
     def test_add(self) -> None:
         """Test addition with different objects."""
         fd1 = FDataGrid([[1, 2, 3, 4], [2, 3, 4, 5]])
@@ -0,0 +1,154 @@
+"""Tests for the parametric plot."""
+import unittest
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.lines import Line2D
+
+from skfda import FDataGrid
+from skfda.exploratory.visualization import ParametricPlot
+
+
+class TestParametricPlotData(unittest.TestCase):
+    """Test the data validation of the parametric plot."""
+
+    def setUp(self) -> None:
+        """Define the datasets."""
+        grid_points = [0, 1, 2, 3]
+        self.fd_x = FDataGrid(
+            [[0, 1, 2, 3], [1, 2, 3, 4], [2, 3, 4, 5]],
+            grid_points,
+        )
+        self.fd_y = FDataGrid(
+            [[0, 1, 4, 9], [1, 0, 1, 0], [3, 2, 1, 0]],
+            grid_points,
+        )
+
+    def test_different_n_samples(self) -> None:
+        """Test that the number of samples is checked on construction."""
+        with self.assertRaises(ValueError):
+            ParametricPlot(self.fd_x, self.fd_y[:2])
+
+    def test_different_grid_points(self) -> None:
+        """Test that the grid points are checked on construction."""
+        fd_y = FDataGrid(self.fd_y.data_matrix, [0, 1, 2, 4])
+
+        with self.assertRaises(ValueError):
+            ParametricPlot(self.fd_x, fd_y)
+
+    def test_wrong_codomain(self) -> None:
+        """Test that the codomain is checked on construction."""
+        with self.assertRaises(ValueError):
+            ParametricPlot(self.fd_x)
+
+        with self.assertRaises(ValueError):
+            ParametricPlot(
+                self.fd_x.concatenate(self.fd_y, as_coordinates=True),
+                self.fd_y,
+            )
+
+    def test_fd_final(self) -> None:
+        """Test that both coordinates are concatenated only once."""
+        plot = ParametricPlot(self.fd_x, self.fd_y)
+
+        fd_final = plot.fd_final
+
+        self.assertIs(plot.fd_final, fd_final)
+        np.testing.assert_array_equal(
+            fd_final.data_matrix,
+            np.stack(
+                (self.fd_x.data_matrix[..., 0], self.fd_y.data_matrix[..., 0]),
+                axis=-1,
+            ),
+        )
+
+
+class TestParametricPlot(unittest.TestCase):
+    """Test the curves drawn by the parametric plot."""
+
+    def setUp(self) -> None:
+        """Define the datasets."""
+        grid_points = [0, 1, 2, 3]
+        self.fd_x = FDataGrid(
+            [[0, 1, 2, 3], [1, 2, 3, 4], [2, 3, 4, 5]],
+            grid_points,
+            dataset_name="dataset",
+            coordinate_names=("x",),
+        )
+        self.fd_y = FDataGrid(
+            [[0, 1, 4, 9], [1, 0, 1, 0], [3, 2, 1, 0]],
+            grid_points,
+            coordinate_names=("y",),
+        )
+        self.fd_xy = self.fd_x.concatenate(self.fd_y, as_coordinates=True)
+
+    def tearDown(self) -> None:
+        """Close the figures."""
+        plt.close("all")
+
+    def _check_lines(self, plot: ParametricPlot) -> None:
+        """Check that each sample is drawn as its own line."""
+        self.assertEqual(plot.artists.shape, (3, 1))
+
+        for i, line in enumerate(plot.artists[:, 0]):
+            self.assertIsInstance(line, Line2D)
+            np.testing.assert_array_equal(
+                line.get_xydata(),
+                np.column_stack((
+                    self.fd_x.data_matrix[i, :, 0],
+                    self.fd_y.data_matrix[i, :, 0],
+                )),
+            )
+
+    def test_two_scalar_fdata(self) -> None:
+        """Test plotting two scalar functions as coordinates."""
+        plot = ParametricPlot(self.fd_x, self.fd_y)
+        fig = plot.plot()
+
+        self._check_lines(plot)
+        self.assertEqual(fig.axes[0].get_xlabel(), "x")
+        self.assertEqual(fig.axes[0].get_ylabel(), "y")
+        self.assertEqual(fig._suptitle.get_text(), "dataset")
+
+    def test_vector_valued_fdata(self) -> None:
+        """Test plotting a function with two coordinates."""
+        plot = ParametricPlot(self.fd_xy)
+        fig = plot.plot()
+
+        self._check_lines(plot)
+        self.assertEqual(fig.axes[0].get_xlabel(), "x")
+        self.assertEqual(fig.axes[0].get_ylabel(), "y")
+        self.assertEqual(fig._suptitle.get_text(), "dataset")
+
+    def test_default_labels(self) -> None:
+        """Test the labels used when the coordinates have no names."""
+        fd_xy = FDataGrid(self.fd_xy.data_matrix, self.fd_xy.grid_points)
+        fig = ParametricPlot(fd_xy).plot()
+
+        self.assertEqual(fig.axes[0].get_xlabel(), "Function 1")
+        self.assertEqual(fig.axes[0].get_ylabel(), "Function 2")
+        self.assertIsNone(fig._suptitle)
+
+    def test_group_colors(self) -> None:
+        """Test that each sample is drawn with the color of its group."""
+        plot = ParametricPlot(
+            self.fd_x,
+            self.fd_y,
+            group=[0, 1, 0],
+            group_colors=["red", "blue"],
+        )
+        plot.plot()
+
+        self.assertEqual(
+            [line.get_color() for line in plot.artists[:, 0]],
+            ["red", "blue", "red"],
+        )
+
+    def test_wrong_input(self) -> None:
+        """Test that invalid data cannot be plotted."""
+        with self.assertRaises(ValueError):
+            ParametricPlot(self.fd_x).plot()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,7 @@ import numpy as np
 
 from skfda._utils import _classifier_get_classes
 from skfda.datasets import fetch_growth
+from skfda.exploratory.depth import ModifiedBandDepth
 from skfda.ml.classification import KNeighborsClassifier
 from skfda.preprocessing.dim_reduction.variable_selection import (
     RecursiveMaximaHunting,
@@ -57,5 +58,53 @@ class TestPerClassTransformer(unittest.TestCase):
         )
 
 
+class TestPerClassTransformerOneDimensional(unittest.TestCase):
+    """Tests for PCT with transformers returning one value per sample."""
+
+    def test_array_output_columns(self) -> None:
+        """Check that each class produces a column of the output."""
+        random_state = np.random.RandomState(0)
+        X = FDataGrid(random_state.normal(size=(30, 10)))
+        y = np.arange(30) % 3
+
+        t = PerClassTransformer[FDataGrid, np.typing.NDArray[np.float_]](
+            ModifiedBandDepth(),
+            array_output=True,
+        )
+        transformed = t.fit_transform(X, y)
+
+        manual = np.column_stack([
+            ModifiedBandDepth().fit(X[y == cur_class]).transform(X)
+            for cur_class in range(3)
+        ])
+
+        np.testing.assert_allclose(transformed, manual)
+
+    def test_parallel_transform(self) -> None:
+        """Check that parallel jobs give the same output."""
+        random_state = np.random.RandomState(0)
+        X = FDataGrid(random_state.normal(size=(30, 10)))
+        y = np.arange(30) % 3
+
+        sequential = PerClassTransformer[
+            FDataGrid,
+            np.typing.NDArray[np.float_],
+        ](
+            ModifiedBandDepth(),
+            array_output=True,
+        ).fit_transform(X, y)
+
+        parallel = PerClassTransformer[
+            FDataGrid,
+            np.typing.NDArray[np.float_],
+        ](
+            ModifiedBandDepth(),
+            array_output=True,
+            n_jobs=2,
+        ).fit_transform(X, y)
+
+        np.testing.assert_allclose(parallel, sequential)
+
+
 if __name__ == '__main__':
     unittest.main()